@@ -0,0 +1,12 @@
+"""Builds the optional Cython solver kernel:
+
+    python setup.py build_ext --inplace
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='wooden-puzzle-box',
+    setup_requires=['Cython'],
+    ext_modules=cythonize('solver.pyx'),
+)
@@ -16,6 +16,24 @@ pieces.
 """
 
 
+# Optional accelerators.  If numba is installed, the recursive search
+# runs as JIT-compiled native code (_solveCompiled below); if the Cython
+# module has been built (python setup.py build_ext --inplace), that wins
+# instead -- same kernel, no JIT warmup.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+try:
+    import solver as _cythonSolver
+except ImportError:
+    _cythonSolver = None
+
+
 class Box(object):
     """Defines the width and height of the box."""
     def __init__(self):
@@ -23,12 +41,27 @@ class Box(object):
         self.y = 5
 
 
+class FoundIt(Exception):
+    """Raised by solve() in stop-on-first mode when a combination solves
+    both boards, to unwind straight out of the search loop.  Carries the
+    winning piece names and both boards' solutions."""
+    def __init__(self, names, soln, soln2):
+        Exception.__init__(self, names)
+        self.names = names
+        self.soln = soln
+        self.soln2 = soln2
+
+
 class Move(object):
     """
     Represents a Piece in a specific position and orientation.
     As in, we can solve the puzzle by making a series of specific
     Moves, one correct Move with each Piece.
     """
+    # There are thousands of Moves; slots keep them small and make
+    # .mask lookups cheaper.
+    __slots__ = ('piece', 'mask')
+
     def __init__(self, piece, ascii=None, mask=None):
         """Specify ascii (2d ascii art of the placement) or mask (1d bitmask
         of the piece.)."""
@@ -46,15 +79,6 @@ class Move(object):
         number = ''.join(binary(word) for word in shape.art)
         return int(number, 2)
 
-    def fits(self, move2):
-        """Can this move and another move be made legally?"""
-        return not (self.mask & move2.mask)
-
-    def combined(self, move2):
-        """The result of making two moves -- a larger "move" that is the
-        combination of the two."""
-        return Move(self.piece, mask=self.mask | move2.mask)
-
     def __str__(self):
         return str(self.toAsciiShape())
 
@@ -81,7 +105,7 @@ class Move(object):
     def __hash__(self):
         return self.mask
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        return self.mask == other.mask
 
 
 class Piece(object):
@@ -97,6 +121,9 @@ class Piece(object):
         self.name = name
         self.box = box
         self.moves = self._moves(shape)
+        # The raw bitmasks of every move, for the solver's hot loop -- much
+        # cheaper to test than Move objects.
+        self.masks = tuple(sorted(move.mask for move in self.moves))
 
     def _moves(self, shape):
         """
@@ -114,10 +141,9 @@ class Piece(object):
         ]
         """
         x, y = self.box.x, self.box.y
-        return {Move(self, translation)
-                for rotation in AsciiShape(shape).rotations()
-                for flip in rotation.flips()
-                for translation in flip.translations(x, y)}
+        return {Move(self, mask=placement)
+                for mask, w, h in orientationMasks(shape)
+                for placement in translatedMasks(mask, w, h, x, y)}
 
 
 class AsciiShape(object):
@@ -127,58 +153,22 @@ class AsciiShape(object):
       'art' is the 2d ascii art, composed of a list of 'words', which are
       strings each representing a row of the art.  The art is any characters
       on a background of 'blanks' (space characters).
+    Stored as a single flat w*h bytearray, one byte per cell; 'art' is
+    rendered from the buffer on demand.  Geometry -- rotating, flipping,
+    sliding -- all happens on int bitmasks now (orientationMasks and
+    translatedMasks); this class just draws.
     """
     def __init__(self, art):
         """art: a list of strings, representing an ascii drawing on a
         background made of spaces.  All strings must be the same length."""
-        self.art = art
-
-    def rotations(self):
-        """Returns a list of all 4 rotations of the ascii shape."""
-        r1 = self.rotated()
-        r2 = r1.rotated()
-        r3 = r2.rotated()
-        return [self, r1, r2, r3]
-
-    def rotated(self):
-        """Returns the ascii shape rotated 90 degrees. Really."""
-        return AsciiShape(self._flipped(self._pivoted(self.art)))
-
-    def flips(self):
-        """Returns a list of the ascii shape, and the shape flipped."""
-        return [self, AsciiShape(self._flipped(self.art))]
-
-    def _flipped(self, art):
-        """Mirrors the art about the vertical axis."""
-        return [''.join(reversed(word)) for word in art]
-
-    def translations(self, x, y):
-        """Return all translations of the ascii shape on an x by y grid."""
-        def rowSlides(art):
-            result = [art]
-            while not art[-1].strip(): # blank bottom word
-                art = art[-1:] + art[:-1]
-                result.append(art)
-            return result
-
-        def colSlides(art):
-            return [self._pivoted(pivotedArt)
-                    for pivotedArt in rowSlides(self._pivoted(art))]
-
-        shapeAtTopLeft = self._extend(self.art, x, y)
-        return [AsciiShape(art)
-                for row in rowSlides(shapeAtTopLeft)
-                for art in colSlides(row)]
-
-    def _pivoted(self, art):
-        """Turn rows into cols and vice versa."""
-        return [''.join(x) for x in zip(*art)]
-
-    def _extend(self, art, x, y):
-        """Pad the right and bottom edges of |art| to a total of x by y."""
-        xgrown = [ word + ' '*(x-len(word)) for word in art ]
-        yrows = [' '*x] * (y - len(art))
-        return xgrown + yrows
+        self.w = len(art[0])
+        self.h = len(art)
+        self.buf = bytearray(''.join(art), 'ascii')
+
+    @property
+    def art(self):
+        return [self.buf[row*self.w:(row+1)*self.w].decode('ascii')
+                for row in range(self.h)]
 
     def __str__(self):
         """A pretty ascii printout of the shape."""
@@ -193,7 +183,84 @@ class AsciiShape(object):
         return '\n%s\n' % str(self)
 
 
+def orientationMasks(shape):
+    """All distinct rotations and flips of ascii |shape|, as
+    (mask, width, height) triples.  Working on ints instead of ascii art
+    skips all the string building, and symmetric orientations (the plus
+    looks the same all 8 ways) dedupe for free."""
+    triple = shapeAsMask(shape)
+    seen = []
+    for _ in range(4):
+        for candidate in (triple, _flippedMask(*triple)):
+            if candidate not in seen:
+                seen.append(candidate)
+        triple = _rotatedMask(*triple)
+    return seen
+
+
+def shapeAsMask(art):
+    """Convert ascii |art| to a (mask, width, height) triple.  Cell
+    (x, y), counting from the bottom-right corner, is bit y*width+x --
+    the same layout Move._asMask gives a 6-wide board."""
+    w, h = len(art[0]), len(art)
+    mask = 0
+    for r, word in enumerate(art):
+        for c, char in enumerate(word):
+            if char != ' ':
+                mask |= 1 << ((h-1-r) * w + (w-1-c))
+    return mask, w, h
+
+
+def translatedMasks(mask, w, h, x, y):
+    """Every placement of orientation (mask, w, h) on an x by y board,
+    as board bitmasks: re-anchor the orientation's bits into x-wide rows
+    at the bottom-right corner, then each slide is just a shift."""
+    anchored = 0
+    while mask:
+        bit = (mask & -mask).bit_length() - 1
+        anchored |= 1 << ((bit // w) * x + bit % w)
+        mask &= mask - 1
+    return [anchored << (dy*x + dx)
+            for dy in range(y - h + 1)
+            for dx in range(x - w + 1)]
+
+
+def _rotatedMask(mask, w, h):
+    """|mask| rotated 90 degrees, by remapping each set bit's (x, y) to
+    (y, w-1-x).  Returns an (h, w)-sized triple."""
+    out = 0
+    while mask:
+        bit = (mask & -mask).bit_length() - 1
+        x, y = bit % w, bit // w
+        out |= 1 << ((w-1-x) * h + y)
+        mask &= mask - 1
+    return out, h, w
+
+
+def _flippedMask(mask, w, h):
+    """|mask| mirrored about the vertical axis."""
+    out = 0
+    while mask:
+        bit = (mask & -mask).bit_length() - 1
+        x, y = bit % w, bit // w
+        out |= 1 << (y * w + (w-1-x))
+        mask &= mask - 1
+    return out, w, h
+
+
 BOX = Box()
+FULL_BOARD = (1 << (BOX.x * BOX.y)) - 1 # every cell of one layer occupied
+# The columns holding the lowest and highest bit of each row, for bit
+# shifts that must not wrap around a row boundary.
+RIGHT_EDGE = sum(1 << (BOX.x * row) for row in range(BOX.y))
+LEFT_EDGE = RIGHT_EDGE << (BOX.x - 1)
+
+try:
+    _popcount = int.bit_count # native POPCNT on Python 3.10+
+except AttributeError:
+    def _popcount(mask):
+        return bin(mask).count('1')
+
 PIECES = [
         # The first 6 pieces and last 6 pieces each form a layer in
         # a 6x5 box.  But we shuffle in solve() just to prove to ourselves
@@ -213,8 +280,10 @@ PIECES = [
         ]
 
 
-def solve():
-    """Solves the puzzle.
+def solve(stopOnFirst=False):
+    """Solves the puzzle.  If |stopOnFirst| (the --any flag), stops at
+    the first combination that solves both boards and returns its
+    (soln, soln2) pair instead of grinding through all 462.
 
     Alg:
     Call the 1st piece in PIECES the Gold piece.
@@ -233,60 +302,329 @@ def solve():
     import random
     random.shuffle(PIECES)
 
-    # A pseudo-Move that is an empty board of the right dimensions.
-    initialBoard = Move(PIECES[0], mask=0)
-
-    gold = PIECES[0] # see comments above for name explanation
+    # Each gold+5 combination is an independent subsearch, so farm them
+    # out to one worker per core.  Combinations are passed as piece
+    # names, which mean the same thing in every worker -- spawn-based
+    # platforms re-import this module and don't see our shuffle.
     from itertools import combinations
-    ways_to_join_gold = combinations(PIECES[1:], 5)
-    for option in ways_to_join_gold:
-        option = list(option) + [gold]
-        debug_names = ', '.join(p.name for p in option)
-        soln = solveRecursive(initialBoard, [], 6, option)
-        if soln is not None:
-            print "Solved board 1: %s..." % debug_names,
-            soln2 = solveRecursive(initialBoard, [], 6,
-                    [p for p in PIECES if p not in option])
-            if soln2 is not None:
-                print "and solved board 2."
-                print
-                print "Board 1:"
-                print soln
-                print "Board 2:"
-                print soln2
-                print
-                print
-                print
+    import multiprocessing
+    gold = PIECES[0]
+    combos = [(gold.name,) + tuple(p.name for p in others)
+              for others in combinations(PIECES[1:], 5)]
+    pool = multiprocessing.Pool()
+    try:
+        results = pool.imap_unordered(_tryCombo, combos, 8)
+        for debug_names, soln, soln2 in results:
+            if soln is not None:
+                print("Solved board 1: %s..." % debug_names, end=' ')
+                if soln2 is not None:
+                    print("and solved board 2.")
+                    print()
+                    print("Board 1:")
+                    print(soln)
+                    print("Board 2:")
+                    print(soln2)
+                    print()
+                    print()
+                    print()
+                    if stopOnFirst:
+                        raise FoundIt(debug_names, soln, soln2)
+                else:
+                    print("but no solution otherwise.")
             else:
-                print "but no solution otherwise."
-        else:
-            print "No solution for: %s" % debug_names
+                print("No solution for: %s" % debug_names)
+    except FoundIt as found:
+        # Unwind out of the loop and kill the workers mid-combination --
+        # everything they're still computing is now wasted work.
+        pool.terminate()
+        return found.soln, found.soln2
+    else:
+        pool.close()
+        return None
+    finally:
+        pool.join()
 
     #solveWithFixedPieces(box, PIECES[:6]) # random 6 pieces... good luck!
 
 
-def solveRecursive(board, moves, n, unused_pieces):
+def _tryCombo(names):
+    """Search one gold+5 combination, given as piece |names|, and on
+    success also search the complementary 6 pieces.  Runs in a Pool
+    worker.  Returns (debug names, first-board solution or None,
+    second-board solution or None)."""
+    byName = dict((piece.name, piece) for piece in PIECES)
+    # Fail-first: try the pieces with the fewest placements early,
+    # where a dead end costs the least backtracking.
+    byMoveCount = lambda p: len(p.moves)
+    option = sorted((byName[name] for name in names), key=byMoveCount)
+    debug_names = ', '.join(p.name for p in option)
+    soln = solveAsMoves(option)
+    soln2 = None
+    if soln is not None:
+        soln2 = solveAsMoves(sorted(
+                (p for p in PIECES if p.name not in names),
+                key=byMoveCount))
+    return debug_names, soln, soln2
+
+
+def solveAsMoves(pieces, useExactCover=False):
+    """Find a way to place all of |pieces| on an empty board.
+    Returns None if there is no solution, or a list of Moves, one per
+    piece, rebuilt from the solver's raw bitmasks.
+
+    Picks the fastest available backend: the Cython kernel, then numba,
+    then the pure-Python solveRecursive.  Pass |useExactCover| to run
+    the Algorithm X solver instead."""
+    if useExactCover:
+        masks = solveWithExactCover(pieces)
+    elif _cythonSolver is not None and numpy is not None:
+        masks = _solveWithCython(pieces)
+    elif njit is not None:
+        masks = _solveWithNumba(pieces)
+    else:
+        masks = _solveWithRecursion(pieces)
+    if masks is None:
+        return None
+    # The solver uses every piece, in order, so the mask trail lines up
+    # with the piece list.
+    return [Move(piece, mask=mask) for piece, mask in zip(pieces, masks)]
+
+
+def _packedMoves(pieces):
+    """Pack each piece's masks into a row of a padded int64 array, plus
+    a per-piece count vector -- the fixed shape the compiled kernels
+    digest."""
+    width = max(len(piece.masks) for piece in pieces)
+    moves = numpy.zeros((len(pieces), width), dtype=numpy.int64)
+    counts = numpy.zeros(len(pieces), dtype=numpy.int64)
+    for i, piece in enumerate(pieces):
+        moves[i, :len(piece.masks)] = piece.masks
+        counts[i] = len(piece.masks)
+    return moves, counts
+
+
+def _solveWithNumba(pieces):
+    """Run the search in the numba-compiled kernel.  Returns a list of
+    move masks, or None."""
+    moves, counts = _packedMoves(pieces)
+    trail = numpy.zeros(len(pieces), dtype=numpy.int64)
+    if _solveCompiled(0, moves, counts, 0, len(pieces), trail):
+        return [int(mask) for mask in trail]
+    return None
+
+
+def _solveWithRecursion(pieces):
+    """Run the pure-Python solveRecursive search.  Returns a list of
+    move masks in piece order, or None."""
+    trail = solveRecursive(0, (), len(pieces), movesByCell(pieces))
+    if trail is None:
+        return None
+    return [mask for i, mask in sorted(trail)]
+
+
+def _solveWithCython(pieces):
+    """Run the search in the Cython-compiled kernel (see solver.pyx).
+    Returns a list of move masks, or None."""
+    moves, counts = _packedMoves(pieces)
+    trail = numpy.zeros(len(pieces), dtype=numpy.int64)
+    if _cythonSolver.solveMasks(moves, counts, trail):
+        return [int(mask) for mask in trail]
+    return None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _solveCompiled(board, moves, counts, start, n, trail):
+        """The inner loop of solveRecursive as a numba-compiled kernel.
+        Fills |trail| with the winning masks and returns True, or returns
+        False if no solution exists."""
+        if n <= 0:
+            return True
+        for i in range(start, counts.shape[0]):
+            for j in range(counts[i]):
+                mask = moves[i, j]
+                if board & mask == 0:
+                    trail[trail.shape[0] - n] = mask
+                    if _solveCompiled(board | mask, moves, counts,
+                                      i+1, n-1, trail):
+                        return True
+        return False
+
+
+def solveWithExactCover(pieces):
+    """Find a way to place all of |pieces| on an empty board, posed as an
+    exact-cover problem: each of the 30 cells, and each piece, must be
+    covered exactly once.  Columns are cell numbers 0-29 plus one column
+    per piece; each row is one placement, covering its piece's column and
+    the 5 cells of its mask.  Solved with Knuth's Algorithm X, which
+    always branches on the column with the fewest candidate rows -- far
+    fewer dead ends than trying pieces in a fixed order.
+
+    Returns a list of move masks in piece order, or None.
     """
-    Given a |board| layout and a set of |moves| that have been made,
-    find a way to place |n| Pieces from |unused_pieces| on the board.
+    rows = {}
+    for i, piece in enumerate(pieces):
+        for mask in piece.masks:
+            cells = [bit for bit in range(30) if mask >> bit & 1]
+            rows[(i, mask)] = [('piece', i)] + cells
+    columns = {}
+    for row, cols in rows.items():
+        for col in cols:
+            columns.setdefault(col, set()).add(row)
+    soln = _algorithmX(columns, rows)
+    if soln is None:
+        return None
+    return [mask for i, mask in sorted(soln)]
+
+
+def _algorithmX(columns, rows):
+    """Algorithm X on a {column: set(rows)} / {row: [columns]} matrix.
+    Returns a list of the chosen rows, or None.  Destroys and restores
+    |columns| in place as it searches (the "dancing" part)."""
+    if not columns:
+        return [] # every column covered: solved.
+    col = min(columns, key=lambda c: len(columns[c]))
+    for row in list(columns[col]):
+        removed = _cover(columns, rows, row)
+        soln = _algorithmX(columns, rows)
+        _uncover(columns, rows, row, removed)
+        if soln is not None:
+            return [row] + soln
+    return None
+
+
+def _cover(columns, rows, row):
+    """Remove |row|'s columns, and every row that clashes with it, from
+    the matrix.  Returns the removed column contents for _uncover."""
+    removed = []
+    for col in rows[row]:
+        for other in columns[col]:
+            for othercol in rows[other]:
+                if othercol != col:
+                    columns[othercol].remove(other)
+        removed.append(columns.pop(col))
+    return removed
+
+
+def _uncover(columns, rows, row, removed):
+    """Undo a _cover, restoring the matrix exactly."""
+    for col in reversed(rows[row]):
+        columns[col] = removed.pop()
+        for other in columns[col]:
+            for othercol in rows[other]:
+                if othercol != col:
+                    columns[othercol].add(other)
+
+
+def movesByCell(pieces):
+    """Bucket every (piece index, move mask) of |pieces| by the lowest
+    cell the mask covers, for solveRecursive.  With numpy installed each
+    bucket is an (indexes, masks) array pair so the solver can test a
+    whole bucket against the board in one vectorized op; otherwise it's
+    a plain list of (index, mask) tuples."""
+    buckets = [[] for _ in range(30)]
+    for i, piece in enumerate(pieces):
+        for mask in piece.masks:
+            buckets[(mask & -mask).bit_length() - 1].append((i, mask))
+    if numpy is not None:
+        buckets = [(numpy.array([i for i, mask in bucket],
+                                dtype=numpy.int64),
+                    numpy.array([mask for i, mask in bucket],
+                                dtype=numpy.uint32))
+                   for bucket in buckets]
+    return buckets
+
+
+def hasDeadRegion(board):
+    """True if some connected region of empty cells on |board| has a size
+    that isn't a multiple of 5 -- no set of 5-cell pieces can ever fill
+    it, so the board is a dead end.  Finds the regions by flood-filling
+    the empty cells with bit shifts (left/right neighbors must not wrap
+    across a row boundary; up/down shifts fall off the board harmlessly).
+    """
+    empties = ~board & FULL_BOARD
+    while empties:
+        region = empties & -empties # seed: the lowest empty cell
+        while True:
+            grown = region | (((region << 1) & ~RIGHT_EDGE) |
+                              ((region >> 1) & ~LEFT_EDGE) |
+                              (region << BOX.x) |
+                              (region >> BOX.x)) & empties
+            if grown == region:
+                break
+            region = grown
+        if _popcount(region) % 5:
+            return True
+        empties &= ~region
+    return False
+
+
+def solveRecursive(board, trail, n, buckets, used=0, failed=None):
+    """
+    Given a |board| bitmask and the tuple |trail| of (piece index, move
+    mask) pairs already placed on it, find a way to place |n| more
+    Pieces on the board.  |buckets| is movesByCell(pieces), and |used|
+    is a bitmask of piece indexes already placed.
     Returns None if there is no solution.
-    Returns an array of the subsequent Moves needed to place |n|
-    Pieces on the board.
+    Returns the complete trail -- |trail| plus the |n| new placements --
+    as a tuple of (piece index, move mask) pairs, in placement order
+    (lowest empty cell first, not piece order: sort by index to line
+    masks back up with the piece list).  The trail rides down the
+    recursion as a tuple rather than being rebuilt list-by-list on the
+    way back up: tuple concatenation at depth 6 is cheaper than a list
+    allocation per node, and the base case can return the finished
+    answer directly.
+
+    The same partial board can be reached by placing the same pieces in
+    different orders; |failed| remembers every (board, used) state proven
+    unsolvable so each is searched only once.  Both fit in an int key:
+    30 bits of board plus 12 bits of piece indexes.  The cache is only
+    valid for one piece set, so it lives for one top-level call.
+
+    Every step only considers placements covering the lowest-numbered
+    empty cell: some piece has to cover that cell eventually, so trying
+    anything else now just revisits the same boards in a different move
+    order, and a hole no piece can cover is noticed immediately.
+
+    Everything here is a raw int bitmask rather than a Move: this is the
+    hot path, and testing ints avoids millions of small allocations and
+    method calls.
     """
     if n <= 0:
-        return [] # base case: the board is solved; no further moves required.
-    for i, piece in enumerate(unused_pieces):
-        for move in piece.moves:
-            if move.fits(board):
-                soln = solveRecursive(
-                        board.combined(move),
-                        moves + [move],
-                        n-1,
-                        # Try the pieces we haven't already exhausted or used
-                        # ourselves -- no need to try a piece's moves twice.
-                        unused_pieces[i+1:])
-                if soln is not None:
-                    return [move] + soln
+        return trail # base case: the board is solved; no further moves required.
+    if failed is None:
+        failed = set()
+    key = board << 12 | used
+    if key in failed:
+        return None
+    empties = ~board & FULL_BOARD
+    target = (empties & -empties).bit_length() - 1 # lowest empty cell
+    if numpy is not None:
+        # One C-level AND over the whole bucket replaces the per-mask
+        # Python tests.
+        indexes, bucketMasks = buckets[target]
+        fits = numpy.flatnonzero(((board & bucketMasks) == 0) &
+                                 ((used >> indexes) & 1 == 0))
+        candidates = [(int(indexes[j]), int(bucketMasks[j])) for j in fits]
+    else:
+        candidates = [(i, mask) for i, mask in buckets[target]
+                      if not (used >> i & 1) and not (board & mask)]
+    for i, mask in candidates:
+        newBoard = board | mask
+        # If this placement strands a pocket of cells no piece can
+        # fill, don't bother recursing into it.
+        if n > 1 and hasDeadRegion(newBoard):
+            continue
+        soln = solveRecursive(
+                newBoard,
+                trail + ((i, mask),),
+                n-1,
+                buckets,
+                used | 1 << i,
+                failed)
+        if soln is not None:
+            return soln
+    failed.add(key)
     return None
 
 
@@ -295,34 +633,36 @@ def solveWithFixedPieces(box, pieces):
     # NB: After writing the recursive solution above, I stopped maintaining
     # this function, so it may not work.
     options = [
-            # The root option is a blank board.
-            [ (Move(pieces[0], mask=0), []) ]
+            # The root option is a blank board.  Boards are plain int
+            # bitmasks; a Move is only built at the end, for printing.
+            [ (0, []) ]
             ]
     for piece in pieces:
-        print "Adding piece %s" % piece.name
+        print("Adding piece %s" % piece.name)
         thisPiecesOptions = []
         for move in piece.moves:
             for stage, trail in options[-1]:
                 # this is breadth-first search
-                if move.fits(stage):
-                    newOption = (move.combined(stage), trail + [move])
+                if not (stage & move.mask):
+                    newOption = (stage | move.mask, trail + [move])
                     thisPiecesOptions.append(newOption)
         options.append(thisPiecesOptions)
-    print "%d winners!" % len(options[-1])
+    print("%d winners!" % len(options[-1]))
     stage, trail = options[-1][0]
-    print stage
-    print trail
+    print(Move(pieces[0], mask=stage))
+    print(trail)
 
 
 def main():
-    solve()
+    import sys
+    solve(stopOnFirst='--any' in sys.argv[1:])
 
 
 def test():
     b = Box()
     x = Piece('cross', b, [' | ', '---', ' | '])
     for move in x.moves:
-        print move
+        print(move)
 
 
 if __name__ == '__main__':
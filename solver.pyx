@@ -0,0 +1,44 @@
+# cython: boundscheck=False, wraparound=False
+"""
+Cython build of the recursive bitmask search -- the same kernel as
+solve._solveCompiled, for installs that have a C compiler but would
+rather not pull in numba.  Build it in place with
+
+    python setup.py build_ext --inplace
+
+and solve.py will pick it up automatically.  Unlike the numba kernel
+there is no JIT warmup, and the search runs nogil, so it could also be
+driven by plain threads.
+"""
+from libc.stdint cimport int64_t
+
+
+def solveMasks(moves, counts, trail):
+    """Search for a way to place every piece.  |moves| is a padded 2d
+    int64 array of move masks (one row per piece), |counts| the number
+    of real masks in each row, and |trail| an int64 scratch array one
+    slot per piece.  Fills |trail| with the winning masks and returns
+    True, or returns False if there is no solution."""
+    cdef int64_t[:, :] moves_v = moves
+    cdef int64_t[:] counts_v = counts
+    cdef int64_t[:] trail_v = trail
+    cdef bint won
+    with nogil:
+        won = _solveRec(0, moves_v, counts_v, 0, trail_v.shape[0], trail_v)
+    return bool(won)
+
+
+cdef bint _solveRec(int64_t board, int64_t[:, :] moves, int64_t[:] counts,
+                    int start, int n, int64_t[:] trail) nogil:
+    cdef int i, j
+    cdef int64_t mask
+    if n <= 0:
+        return True
+    for i in range(start, counts.shape[0]):
+        for j in range(counts[i]):
+            mask = moves[i, j]
+            if board & mask == 0:
+                trail[trail.shape[0] - n] = mask
+                if _solveRec(board | mask, moves, counts, i+1, n-1, trail):
+                    return True
+    return False